@@ -1,59 +1,104 @@
 from airflow.decorators import dag, task
-from datetime import datetime
+from airflow.operators.latest_only import LatestOnlyOperator
+from datetime import datetime, timedelta
 import logging
+import os
 
 # Importamos los scripts principales del ETL
 from extract import main as extract_main
+from extract import TABLE_NAME as GRAMMY_TABLE
 from transformation import transform_data as transformation_main
+from transformation import SPOTIFY_CSV_PATH, OUTPUT_CSV_PATH, QUARANTINE_CSV_PATH
 from load import main as load_main
+from load import CSV_FILE_PATH
+from load import TABLE_NAME as CLEANED_TABLE
+from execution import run_stage, mysql_table_has_rows, DAGS_FOLDER
 
 logger = logging.getLogger("airflow.task")
 
+GRAMMY_CSV_PATH = os.path.join(DAGS_FOLDER, "the_grammy_awards.csv")
+
+def _source(module_name):
+    """Ruta del script de una etapa: si el código cambia, la etapa se vuelve a ejecutar."""
+    return os.path.join(DAGS_FOLDER, f"{module_name}.py")
+
+# Reintentos acotados con backoff exponencial (aprox. 30s, 60s, 120s; Airflow agrega jitter) ante fallos transitorios
+default_args = {
+    "retries": 3,
+    "retry_delay": timedelta(seconds=30),
+    "retry_exponential_backoff": True,
+    "max_retry_delay": timedelta(minutes=5),
+}
+
 @dag(
     dag_id="etl_workflow",
     start_date=datetime(2025, 8, 1),
     schedule_interval="@daily",
     catchup=True,
-    max_active_runs=1
-
+    max_active_runs=1,
+    default_args=default_args
 )
 def etl_pipeline():
 
     @task()
-    def extract():
+    def extract(ds=None):
         try:
             logger.info("Starting data extraction...")
-            extract_main()
-            logger.info("Extraction completed successfully.")
+            executed = run_stage(
+                "extract", extract_main,
+                inputs=[GRAMMY_CSV_PATH, _source("extract")],
+                output_check=lambda: mysql_table_has_rows(GRAMMY_TABLE),
+                logical_date=ds,
+            )
+            if executed:
+                logger.info("Extraction completed successfully.")
         except Exception as e:
             logger.error(f"Extraction failed: {e}")
             raise
 
     @task()
-    def transform():
+    def transform(ds=None):
         try:
             logger.info("Starting data transformation...")
-            transformation_main()
-            logger.info("Transformation completed successfully.")
+            executed = run_stage(
+                "transform", transformation_main,
+                inputs=[SPOTIFY_CSV_PATH, _source("transformation"), _source("validation"), _source("feature_store")],
+                outputs=[OUTPUT_CSV_PATH, QUARANTINE_CSV_PATH],
+                upstream="extract",
+                logical_date=ds,
+            )
+            if executed:
+                logger.info("Transformation completed successfully.")
         except Exception as e:
             logger.error(f"Transformation failed: {e}")
-            raise  
+            raise
 
     @task()
-    def load():
+    def load(ds=None):
         try:
             logger.info("Starting data load...")
-            load_main()
-            logger.info("Load completed successfully.")
+            executed = run_stage(
+                "load", load_main,
+                inputs=[CSV_FILE_PATH, _source("load")],
+                output_check=lambda: mysql_table_has_rows(CLEANED_TABLE),
+                upstream="transform",
+                logical_date=ds,
+            )
+            if executed:
+                logger.info("Load completed successfully.")
         except Exception as e:
             logger.error(f"Load failed: {e}")
             raise
 
+    # Las ejecuciones de catch-up atrasadas se omiten aquí, antes de iniciar las etapas;
+    # solo la ejecución más reciente (o una disparada manualmente) llega a extract
+    latest_only = LatestOnlyOperator(task_id="latest_only")
+
     extract_task = extract()
     transform_task = transform()
     load_task = load()
 
-    extract_task >> transform_task >> load_task
+    latest_only >> extract_task >> transform_task >> load_task
 
 # Instanciar el DAG
-etl_pipeline()
\ No newline at end of file
+etl_pipeline()
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import logging
+import os
+import mysql.connector
+from datetime import datetime
+from config import get_db
+
+logger = logging.getLogger("airflow.task")
+
+DAGS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+STATE_DIR = os.path.join(DAGS_FOLDER, ".etl_state")
+
+
+def _marker_path(stage):
+    return os.path.join(STATE_DIR, f"{stage}.json")
+
+
+def read_marker(stage):
+    """Devuelve el marcador de la última ejecución exitosa de una etapa (o None)."""
+    try:
+        with open(_marker_path(stage), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def stage_fingerprint(inputs, upstream=None):
+    """Calcula la huella de una etapa a partir de sus archivos de entrada.
+
+    Usa ruta, tamaño y fecha de modificación de cada archivo (sin leer su contenido)
+    y la última ejecución real de la etapa anterior, de modo que si la etapa
+    anterior se vuelve a ejecutar, las siguientes también lo hacen."""
+    digest = hashlib.sha256()
+    for path in sorted(inputs):
+        digest.update(path.encode())
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f":{stat.st_size}:{stat.st_mtime_ns}".encode())
+        else:
+            digest.update(b":missing")
+    if upstream:
+        marker = read_marker(upstream) or {}
+        digest.update(f"{marker.get('fingerprint', 'pending')}:{marker.get('completed_at', '')}".encode())
+    return digest.hexdigest()
+
+
+def mysql_table_has_rows(table):
+    """Indica si una tabla de MySQL existe y tiene al menos una fila.
+
+    Sirve como verificación de salida para las etapas que escriben en la base
+    de datos, cuyo estado no se refleja en los archivos de dags/. Los errores
+    de conexión se propagan para que Airflow reintente la tarea."""
+    with get_db() as conn:
+        with conn.cursor() as cursor:
+            try:
+                cursor.execute(f"SELECT 1 FROM {table} LIMIT 1")
+            except mysql.connector.ProgrammingError:
+                # La tabla no existe (p. ej. volumen de MySQL recreado)
+                return False
+            return cursor.fetchone() is not None
+
+
+def _write_marker(stage, marker):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    tmp_path = f"{_marker_path(stage)}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(marker, f, indent=2)
+    os.replace(tmp_path, _marker_path(stage))
+
+
+def run_stage(stage, func, inputs=(), outputs=(), output_check=None, upstream=None, logical_date=None):
+    """Ejecuta una etapa del ETL solo si sus entradas cambiaron desde la última ejecución.
+
+    La etapa se omite cuando la huella coincide con el marcador guardado, todos
+    los archivos de `outputs` existen y `output_check` (si se indica) confirma que
+    la salida sigue presente, p. ej. la tabla de MySQL. Así las ejecuciones de
+    catch-up sobre los mismos datos se reducen a una sola, sin omitir una etapa
+    cuya salida se perdió. Las excepciones de `func` se propagan sin registrar
+    el marcador, para que Airflow aplique sus reintentos.
+    Retorna True si la etapa se ejecutó y False si se omitió."""
+    fingerprint = stage_fingerprint(inputs, upstream)
+    marker = read_marker(stage)
+
+    if (
+        marker
+        and marker.get('fingerprint') == fingerprint
+        and all(os.path.exists(p) for p in outputs)
+        and (output_check is None or output_check())
+    ):
+        logger.info(
+            f"⏭️  Etapa '{stage}' omitida para {logical_date}: entradas sin cambios desde la "
+            f"ejecución de {marker.get('logical_date')} ({marker.get('completed_at')})"
+        )
+        marker['last_skipped_at'] = datetime.now().isoformat()
+        _write_marker(stage, marker)
+        return False
+
+    func()
+    _write_marker(stage, {
+        'fingerprint': fingerprint,
+        'logical_date': logical_date,
+        'completed_at': datetime.now().isoformat(),
+    })
+    return True
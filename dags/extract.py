@@ -31,11 +31,10 @@ def main():
                     print(f"Archivo CSV cargado: {csv_path}")
                 except FileNotFoundError:
                     print("No se encontró el archivo CSV. Verifica la ruta.")
-                    return
+                    raise
 
                 if df.empty:
-                    print("El archivo CSV está vacío. No se puede procesar.")
-                    return
+                    raise ValueError("El archivo CSV está vacío. No se puede procesar.")
 
                 df.columns = [col.strip().replace(" ", "_").replace("-", "_").replace("/", "_") for col in df.columns]
 
@@ -62,12 +61,8 @@ def main():
                 columns_sql = ",\n    ".join(columns_sql_parts)
 
                 # ------------------ CREACIÓN DE LA TABLA ------------------ #
-                try:
-                    cursor.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
-                    print(f"Tabla '{TABLE_NAME}' eliminada correctamente.")
-                except mysql.connector.Error as err:
-                    print(f"Error al eliminar la tabla existente: {err}")
-                    return
+                cursor.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+                print(f"Tabla '{TABLE_NAME}' eliminada correctamente.")
 
                 create_table_query = f"""
                 CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
@@ -76,12 +71,8 @@ def main():
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
                 """
 
-                try:
-                    cursor.execute(create_table_query)
-                    print(f"\nTabla '{TABLE_NAME}' creada correctamente.")
-                except mysql.connector.Error as err:
-                    print(f"Error al crear la tabla: {err}")
-                    return
+                cursor.execute(create_table_query)
+                print(f"\nTabla '{TABLE_NAME}' creada correctamente.")
 
                 # ------------------ INSERCIÓN DE DATOS ------------------ #
                 def to_mysql_compatible(value):
@@ -102,16 +93,14 @@ def main():
                 placeholders = ", ".join(["%s"] * len(df.columns))
                 insert_query = f"INSERT INTO {TABLE_NAME} ({', '.join(df.columns)}) VALUES ({placeholders})"
 
-                try:
-                    cursor.executemany(insert_query, rows)
-                    conn.commit()
-                    print(f"\n{len(rows)} registros insertados en la tabla '{TABLE_NAME}' correctamente.")
-                except mysql.connector.Error as err:
-                    print(f"Error al insertar datos: {err}")
-                    return
+                cursor.executemany(insert_query, rows)
+                conn.commit()
+                print(f"\n{len(rows)} registros insertados en la tabla '{TABLE_NAME}' correctamente.")
 
     except mysql.connector.Error as err:
-        print(f"Error de conexión: {err}")
+        # Errores de conexión, DROP, CREATE o INSERT: se reportan una sola vez aquí
+        print(f"Error de MySQL: {err}")
+        raise
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+import fcntl
+import json
+import logging
+import os
+import shutil
+import time
+
+SPOTIFY_CSV_PATH = "/opt/airflow/dags/spotify_dataset.csv"
+STORE_DIR = "/opt/airflow/dags/spotify_store"
+MANIFEST_FILE = "manifest.json"
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = ".lock"
+STORE_VERSION = 2
+
+
+def _source_signature(csv_path):
+    """Identifica la versión del CSV de origen por tamaño y fecha de modificación."""
+    stat = os.stat(csv_path)
+    return {'path': os.path.abspath(csv_path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _write_version(df, csv_path, version_dir):
+    """Escribe los arreglos, vocabularios y el manifiesto de una versión del almacén."""
+    os.makedirs(version_dir)
+
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        base = f"col{i:03d}"
+
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+            values = series.to_numpy()
+            np.save(os.path.join(version_dir, f"{base}.npy"), values)
+            columns.append({'name': col, 'kind': 'numeric', 'file': f"{base}.npy", 'dtype': str(values.dtype)})
+            continue
+
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred == 'boolean':
+            # Booleanos con nulos (p. ej. 'explicit' con un valor faltante): valores + máscara de nulos
+            np.save(os.path.join(version_dir, f"{base}.npy"), series.fillna(False).to_numpy(dtype=bool))
+            np.save(os.path.join(version_dir, f"{base}_null.npy"), series.isna().to_numpy())
+            columns.append({'name': col, 'kind': 'nullable_bool', 'file': f"{base}.npy", 'null_mask': f"{base}_null.npy"})
+        elif inferred in ('string', 'empty'):
+            # Los nulos quedan con código -1, que pandas interpreta como NaN.
+            # Los códigos se guardan con el ancho que usa pandas para no copiarlos al abrir.
+            categorical = pd.Categorical(series)
+            np.save(os.path.join(version_dir, f"{base}.npy"), categorical.codes)
+            with open(os.path.join(version_dir, f"{base}.json"), 'w', encoding='utf-8') as f:
+                json.dump([str(c) for c in categorical.categories], f, ensure_ascii=False)
+            columns.append({'name': col, 'kind': 'string', 'file': f"{base}.npy", 'vocab': f"{base}.json"})
+        else:
+            raise ValueError(f"La columna '{col}' tiene tipos mixtos ({inferred}) y no puede guardarse en el almacén")
+
+    manifest = {
+        'version': STORE_VERSION,
+        'rows': len(df),
+        'source': _source_signature(csv_path),
+        'columns': columns,
+    }
+    with open(os.path.join(version_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _current_version_dir(store_dir):
+    """Resuelve el directorio de la versión publicada según el archivo puntero."""
+    try:
+        with open(os.path.join(store_dir, CURRENT_FILE), encoding='utf-8') as f:
+            return os.path.join(store_dir, f.read().strip())
+    except FileNotFoundError:
+        return None
+
+
+def build_feature_store(csv_path=SPOTIFY_CSV_PATH, store_dir=STORE_DIR):
+    """Convierte el CSV de Spotify en un almacén columnar en disco.
+
+    Las columnas numéricas y booleanas se guardan como arreglos .npy de ancho fijo
+    (los booleanos con nulos, más una máscara de nulos); las de texto se codifican
+    con diccionario (códigos enteros en .npy + vocabulario JSON). Cualquier otra
+    columna con tipos mixtos produce un error en lugar de convertirse a texto.
+    Cada construcción se escribe en un subdirectorio de versión nuevo y se publica
+    reemplazando atómicamente (os.replace) el archivo puntero CURRENT, por lo que los
+    lectores siempre ven una versión completa. Un lock de archivo evita que dos
+    workers reconstruyan el almacén a la vez."""
+    os.makedirs(store_dir, exist_ok=True)
+
+    with open(os.path.join(store_dir, LOCK_FILE), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        # Otro worker pudo haberlo reconstruido mientras esperábamos el lock
+        if is_store_fresh(csv_path, store_dir):
+            return _read_manifest(store_dir)
+
+        logging.info(f"Construyendo almacén de características desde {csv_path}...")
+        df = pd.read_csv(csv_path)
+
+        version_name = f"v{time.time_ns()}"
+        manifest = _write_version(df, csv_path, os.path.join(store_dir, version_name))
+
+        previous_dir = _current_version_dir(store_dir)
+        pointer_tmp = os.path.join(store_dir, f"{CURRENT_FILE}.tmp")
+        with open(pointer_tmp, 'w', encoding='utf-8') as f:
+            f.write(version_name)
+        os.replace(pointer_tmp, os.path.join(store_dir, CURRENT_FILE))
+
+        # Conservar la versión anterior para lectores que aún la estén abriendo
+        keep = {version_name, os.path.basename(previous_dir) if previous_dir else None}
+        for entry in os.listdir(store_dir):
+            if entry.startswith('v') and entry not in keep:
+                shutil.rmtree(os.path.join(store_dir, entry), ignore_errors=True)
+
+    logging.info(f"✅ Almacén creado en {store_dir}: {manifest['rows']} filas, {len(manifest['columns'])} columnas")
+    return manifest
+
+
+def _read_manifest(store_dir, version_dir=None):
+    version_dir = version_dir or _current_version_dir(store_dir)
+    if version_dir is None:
+        return None
+    try:
+        with open(os.path.join(version_dir, MANIFEST_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def is_store_fresh(csv_path=SPOTIFY_CSV_PATH, store_dir=STORE_DIR):
+    """Indica si el almacén existe y corresponde a la versión actual del CSV."""
+    manifest = _read_manifest(store_dir)
+    if manifest is None or manifest.get('version') != STORE_VERSION:
+        return False
+    if not os.path.exists(csv_path):
+        # Sin CSV de origen, el almacén existente es la única fuente disponible
+        return True
+    return manifest['source'] == _source_signature(csv_path)
+
+
+def open_feature_store(store_dir=STORE_DIR):
+    """Abre el almacén como DataFrame sin volver a parsear el CSV.
+
+    Los .npy se mapean en memoria en modo solo lectura, de modo que varios
+    procesos que abran el mismo almacén comparten las páginas del sistema operativo.
+    Las columnas de texto se devuelven como Categorical sobre los códigos mapeados,
+    sin copiarlos; solo el vocabulario JSON se carga en cada proceso. Los booleanos
+    con nulos se materializan como objeto (True/False/NaN), igual que con pd.read_csv."""
+    version_dir = _current_version_dir(store_dir)
+    manifest = _read_manifest(store_dir, version_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No se encontró el almacén de características en {store_dir}")
+
+    data = {}
+    for column in manifest['columns']:
+        values = np.load(os.path.join(version_dir, column['file']), mmap_mode='r')
+        if column['kind'] == 'string':
+            with open(os.path.join(version_dir, column['vocab']), encoding='utf-8') as f:
+                vocab = json.load(f)
+            data[column['name']] = pd.Categorical.from_codes(values, dtype=pd.CategoricalDtype(vocab))
+        elif column['kind'] == 'nullable_bool':
+            null_mask = np.load(os.path.join(version_dir, column['null_mask']))
+            restored = values.astype(object)
+            restored[null_mask] = np.nan
+            data[column['name']] = restored
+        else:
+            data[column['name']] = values
+
+    return pd.DataFrame(data, copy=False)
+
+
+def load_spotify_features(csv_path=SPOTIFY_CSV_PATH, store_dir=STORE_DIR):
+    """Devuelve el dataset de Spotify desde el almacén, reconstruyéndolo si está desactualizado."""
+    if not is_store_fresh(csv_path, store_dir):
+        build_feature_store(csv_path, store_dir)
+    return open_feature_store(store_dir)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    build_feature_store()
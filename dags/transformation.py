@@ -2,9 +2,11 @@ import pandas as pd
 import re
 import logging
 from config import get_db_connection
+from feature_store import load_spotify_features, SPOTIFY_CSV_PATH
+from validation import validate_dataframe, log_validation_summary
 
-SPOTIFY_CSV_PATH = "/opt/airflow/dags/spotify_dataset.csv"
 OUTPUT_CSV_PATH = "/opt/airflow/dags/merged_grammy_spotify_clean.csv"
+QUARANTINE_CSV_PATH = "/opt/airflow/dags/quarantine_grammy_spotify.csv"
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -19,7 +21,7 @@ def normalize_text(s):
 def transform_data():
     try:
         logging.info("Cargando dataset de Spotify...")
-        df_spotify = pd.read_csv(SPOTIFY_CSV_PATH)
+        df_spotify = load_spotify_features(SPOTIFY_CSV_PATH)
 
         logging.info("Conectando a MySQL...")
         conn = get_db_connection()
@@ -40,9 +42,6 @@ def transform_data():
         df_spotify['album_name_norm'] = df_spotify['album_name'].astype(str).apply(normalize_text)
         df_spotify['artists_norm'] = df_spotify['artists'].astype(str).apply(lambda x: normalize_text(x).replace(',', ';'))
 
-        # Filtrar años
-        df_grammy = df_grammy[df_grammy['year'] >= 1958]
-
         logging.info("Realizando merge inteligente entre Grammy y Spotify...")
         
         # Clasificar categorías por tipo (canción vs álbum/otros)
@@ -144,15 +143,11 @@ def transform_data():
             lambda x: 'Explicit' if x == True else 'No Explicit'
         )
         
-        # FILTRAR: Solo mantener registros con datos COMPLETOS (Grammy + Spotify)
-        # Estos son los datos útiles para decisiones estratégicas
-        df_clean = df_merged[
-            (df_merged['popularity'] > 0) &   
-            (df_merged['track_genre'] != '') &        
-            (df_merged['duration_ms'] > 0) &          
-            (df_merged['artists'] != '') &           
-            (df_merged['track_name'] != '')           
-        ].copy()
+        # VALIDAR: Solo mantener registros con datos COMPLETOS y dentro de rango (Grammy + Spotify)
+        # Estos son los datos útiles para decisiones estratégicas; el resto va a cuarentena
+        df_clean, df_quarantine, rule_counts, _ = validate_dataframe(df_merged)
+        log_validation_summary(rule_counts, len(df_merged), len(df_quarantine))
+        df_quarantine.to_csv(QUARANTINE_CSV_PATH, index=False)
         
         # Eliminar la columna explicit original (ya tenemos explicit_label)
         df_clean = df_clean.drop(columns=['explicit'], errors='ignore')
@@ -230,6 +225,7 @@ def transform_data():
         logging.error(f"Error en ETL: {e}")
         if 'conn' in locals():
             conn.close()
+        raise
 
 if __name__ == "__main__":
     transform_data()
\ No newline at end of file
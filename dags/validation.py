@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import logging
+from datetime import datetime
+
+# Límites de las reglas de calidad
+MIN_YEAR = 1958
+MAX_YEAR = datetime.now().year
+AUDIO_FEATURES = ['danceability', 'energy', 'speechiness', 'acousticness',
+                  'instrumentalness', 'liveness', 'valence']
+
+# Reglas declarativas: cada una describe qué filas se RECHAZAN.
+# transform_data rellena con 0 los nulos numéricos antes de validar, por eso
+# las columnas obligatorias usan un mínimo exclusivo en 0.
+#   - range:     el valor debe estar entre min y max (min_inclusive controla el borde inferior)
+#   - not_blank: el valor no puede ser nulo ni una cadena vacía
+VALIDATION_RULES = [
+    {'name': 'popularity_positive', 'column': 'popularity', 'check': 'range', 'min': 0, 'max': 100, 'min_inclusive': False},
+    {'name': 'duration_positive', 'column': 'duration_ms', 'check': 'range', 'min': 0, 'max': None, 'min_inclusive': False},
+    {'name': 'tempo_range', 'column': 'tempo', 'check': 'range', 'min': 0, 'max': 300, 'min_inclusive': False},
+    {'name': 'year_range', 'column': 'year', 'check': 'range', 'min': MIN_YEAR, 'max': MAX_YEAR},
+    *[
+        {'name': f'{col}_range', 'column': col, 'check': 'range', 'min': 0, 'max': 1}
+        for col in AUDIO_FEATURES
+    ],
+    {'name': 'track_name_not_blank', 'column': 'track_name', 'check': 'not_blank'},
+    {'name': 'artists_not_blank', 'column': 'artists', 'check': 'not_blank'},
+    {'name': 'track_genre_not_blank', 'column': 'track_genre', 'check': 'not_blank'},
+]
+
+# Columnas que identifican un registro; repetirlas se considera un duplicado
+DUPLICATE_KEYS = ['year', 'category', 'nominee', 'artists', 'track_name']
+DUPLICATE_RULE = 'duplicate'
+
+
+def _rule_mask(df, rule):
+    """Devuelve una máscara booleana (numpy) con True en las filas que fallan la regla."""
+    column = rule['column']
+    if column not in df.columns:
+        # Columna requerida ausente: todas las filas fallan
+        return np.ones(len(df), dtype=bool)
+
+    series = df[column]
+
+    if rule['check'] == 'not_blank':
+        return (series.isna() | (series.astype(str).str.strip() == '')).to_numpy()
+
+    if rule['check'] == 'range':
+        values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+        # NaN nunca pasa una comparación, por lo que también se rechaza
+        valid = ~np.isnan(values)
+        if rule.get('min') is not None:
+            if rule.get('min_inclusive', True):
+                valid &= values >= rule['min']
+            else:
+                valid &= values > rule['min']
+        if rule.get('max') is not None:
+            valid &= values <= rule['max']
+        return ~valid
+
+    raise ValueError(f"Tipo de regla desconocido: {rule['check']}")
+
+
+def _duplicate_mask(df, keys, seen_hashes):
+    """Marca duplicados dentro del bloque y contra los hashes de bloques anteriores."""
+    keys = [k for k in keys if k in df.columns]
+    if not keys or df.empty:
+        return np.zeros(len(df), dtype=bool), seen_hashes
+
+    hashes = pd.util.hash_pandas_object(df[keys], index=False).to_numpy()
+    mask = pd.Series(hashes).duplicated(keep='first').to_numpy()
+    if len(seen_hashes):
+        mask = mask | np.isin(hashes, seen_hashes)
+
+    return mask, np.union1d(seen_hashes, hashes)
+
+
+def validate_dataframe(df, rules=VALIDATION_RULES, duplicate_keys=DUPLICATE_KEYS, seen_hashes=None):
+    """Evalúa todas las reglas sobre un bloque en una sola pasada vectorizada.
+
+    Retorna (df_validos, df_cuarentena, conteos_por_regla, seen_hashes).
+    La cuarentena incluye la columna 'failed_rules' con las reglas incumplidas.
+    Pasar el `seen_hashes` retornado al siguiente bloque permite detectar
+    duplicados entre bloques."""
+    if seen_hashes is None:
+        seen_hashes = np.empty(0, dtype=np.uint64)
+
+    names = [rule['name'] for rule in rules] + [DUPLICATE_RULE]
+    failures = np.zeros((len(names), len(df)), dtype=bool)
+    for i, rule in enumerate(rules):
+        failures[i] = _rule_mask(df, rule)
+
+    # Solo se buscan duplicados entre las filas que pasan las demás reglas
+    passed = ~failures[:-1].any(axis=0)
+    dup_mask, seen_hashes = _duplicate_mask(df[passed], duplicate_keys, seen_hashes)
+    failures[-1, np.flatnonzero(passed)] = dup_mask
+
+    rejected = failures.any(axis=0)
+    counts = dict(zip(names, failures.sum(axis=1).tolist()))
+
+    quarantine = df[rejected].copy()
+    reasons = pd.Series('', index=quarantine.index)
+    for name, mask in zip(names, failures[:, rejected]):
+        reasons[mask] += name + ';'
+    quarantine['failed_rules'] = reasons.str.rstrip(';')
+
+    return df[~rejected].copy(), quarantine, counts, seen_hashes
+
+
+def log_validation_summary(counts, total, rejected):
+    """Registra en el log el resumen de la validación por regla."""
+    logging.info(f"Validación: {total - rejected} filas válidas, {rejected} en cuarentena")
+    for name, count in counts.items():
+        if count:
+            logging.info(f"   - {name}: {count} filas rechazadas")